@@ -1,27 +1,90 @@
 # stdlib imports
 import asyncio
-import json
+import io
+import logging
+import mmap
+import os
+import re
 import tempfile
+import traceback
 from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 # 3rd party imports
 import httpx
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 import typer
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen, ModalScreen
-from textual.widgets import DataTable, Footer, Log, Input, Button, Label, Static
+from textual.widgets import DataTable, Footer, Log, Input, Button, Label
 from textual.containers import Container, Horizontal
 from textual.events import Key
+from textual.logging import TextualHandler
 import importlib.resources
 
+try:
+    # Optional Arrow-backed table that renders large row counts much faster
+    from textual_fastdatatable import DataTable as FastDataTable
+except ImportError:
+    FastDataTable = None
+
+try:
+    # Optional linear-time (DFA) regex engine for the filters
+    import re2
+except ImportError:
+    re2 = None
+if re2 is not None and not hasattr(re2, "Options"):
+    re2 = None  # some other "re2" distribution, not google-re2
+
 
 app_cli = typer.Typer()
+log = logging.getLogger(__name__)
+_CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+
+_LOG_WRITE_BATCH = 200  # lines written to a Log widget per event loop tick
+_LOG_TAIL_BYTES = 1024 * 1024  # only the end of a long stdio log is shown
+
+@lru_cache(maxsize=256)
+def _compile_filter(pattern: str):
+    """Compile a user-entered filter regex, reusing earlier compilations."""
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass  # e.g. backreferences, which only the re module supports
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except OverflowError as e:
+        # e.g. "a{99999999999}"; callers only expect re.error for bad input
+        raise re.error(str(e)) from e
+
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+def _literal_filter(pattern: str) -> Optional[str]:
+    """Lowercased pattern if it's a plain substring (no regex syntax), else None."""
+    # Plain substrings are matched with `in`, skipping the regex engine
+    if _REGEX_META.search(pattern):
+        return None
+    return pattern.lower()
+
+def _filter_indices(pattern: str, haystacks: List[str]) -> List[int]:
+    """Indices of the lowercased haystacks matching a filter pattern."""
+    needle = _literal_filter(pattern)
+    if needle is not None:
+        return [i for i, haystack in enumerate(haystacks) if needle in haystack]
+    regex = _compile_filter(pattern)
+    return [i for i, haystack in enumerate(haystacks) if regex.search(haystack)]
 
 class MCPServer(BaseModel):
     name: str
@@ -33,8 +96,55 @@ class MCPServer(BaseModel):
     defaultNamespace: Optional[str] = None
     # Add other fields as needed
 
+    @cached_property
+    def display_type(self) -> str:
+        """Transport shown in the server list, inferred when `type` is unset."""
+        if self.type:
+            return self.type
+        if self.command:
+            return "stdio"
+        if self.url:
+            return "http"
+        return ""
+
+# Validates a whole mcp.json worth of servers in one call
+_SERVERS_ADAPTER = TypeAdapter(List[MCPServer])
+
+class _CountingWriter:
+    """Wraps a binary log file, encoding text written to it and counting the bytes."""
+
+    def __init__(self, file):
+        self._file = file
+        self._n = 0
+
+    def write(self, s):
+        data = s.encode(errors="replace")
+        self._n += len(data)
+        return self._file.write(data)
+
+    def is_empty(self):
+        # A subprocess writes to the fd directly, bypassing the counter, so
+        # fall back to one fstat rather than seeking and reading the file
+        return self._n == 0 and os.fstat(self._file.fileno()).st_size == 0
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+@dataclass
+class ServerState:
+    """Runtime state of one server, kept alongside its MCPServer config."""
+    stdout: Any = None
+    stderr: Any = None
+    tools: list = field(default_factory=list)
+    status: str = ""
+    session: Optional[ClientSession] = None
+    checked: asyncio.Event = field(default_factory=asyncio.Event)
+
+class _LogNotice(str):
+    """A line LogViewScreen shows whatever the filter, e.g. that output was cut."""
+
 class LogViewScreen(Screen):
-    CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+    CSS_PATH = _CSS_PATH
     BINDINGS = [
         Binding("escape", "pop_screen", "Back"),
         Binding("/", "filter", "Filter"),
@@ -45,24 +155,92 @@ class LogViewScreen(Screen):
         self.server_name = server_name
         self.stdout_file = stdout_file
         self.stderr_file = stderr_file
-        self.stdout_lines = []
-        self.stderr_lines = []
-        self.filtered_lines = []
         self.current_regex = ""
         self.log_widget = None
         self.filter_input = None
-        if self.stdout_file:
-            try:
-                self.stdout_file.seek(0)
-                self.stdout_lines = self.stdout_file.read().splitlines()
-            except Exception:
-                pass
-        if self.stderr_file:
-            try:
-                self.stderr_file.seek(0)
-                self.stderr_lines = self.stderr_file.read().splitlines()
-            except Exception:
-                pass
+        self._write_task = None
+        self._rendered_regex = None  # filter the widget contents were drawn with
+        self._stderr_end = 0  # how far into stderr the widget has got
+        self._stderr_size = None  # stderr size seen on the previous refresh
+        self._lines_written = 0  # log lines drawn, not counting notices
+        self._notices = []  # notices drawn, kept to redraw after the placeholder
+        self._placeholder_shown = False
+
+    @staticmethod
+    def _log_size(log_file):
+        if not log_file:
+            return 0
+        if isinstance(log_file, io.StringIO):
+            return len(log_file.getvalue())
+        try:
+            log_file.flush()
+            return os.fstat(log_file.fileno()).st_size
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def _last_line_end(log_file, start, end):
+        """Offset just past the last newline in [start, end), or start if there is none."""
+        if isinstance(log_file, io.StringIO):
+            return log_file.getvalue().rfind("\n", start, end) + 1 or start
+        try:
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.rfind(b"\n", start, end) + 1 or start
+        except (OSError, ValueError):
+            return start
+
+    @staticmethod
+    def _iter_lines(log_file, start=0, end=None):
+        # Walk the file through an mmap so only the lines we hand out get decoded
+        if not log_file:
+            return
+        if end is None:
+            end = LogViewScreen._log_size(log_file)
+        if end <= start:
+            return
+        if isinstance(log_file, io.StringIO):
+            yield from log_file.getvalue()[start:end].splitlines()
+            return
+        try:
+            mm = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        with mm:
+            end = min(end, len(mm))
+            # Only a read from the top is cut to the tail; appends after lines
+            # already on screen must not leave a gap in the middle
+            if start == 0 and end > _LOG_TAIL_BYTES:
+                mm.seek(end - _LOG_TAIL_BYTES)
+                mm.readline()  # skip the partial line we landed in
+                yield _LogNotice(
+                    f"--- showing last {_LOG_TAIL_BYTES // 1024} KiB; earlier output isn't shown or searched ---"
+                )
+            else:
+                mm.seek(start)
+            while (pos := mm.tell()) < end:
+                raw = mm.readline()[:end - pos]
+                yield raw.decode(errors="replace").rstrip("\r\n")
+
+    def _all_lines(self):
+        yield from self._iter_lines(self.stderr_file, end=self._stderr_end)
+        stdout_lines = self._iter_lines(self.stdout_file)
+        first = next(stdout_lines, None)
+        if first is not None:
+            yield "--- STDOUT ---"
+            yield first
+            yield from stdout_lines
+
+    def _line_filter(self):
+        """Predicate for lines matching the current filter, or None to keep them all."""
+        if not self.current_regex:
+            return None
+        needle = _literal_filter(self.current_regex)
+        if needle is not None:
+            return lambda line: needle in line.lower()
+        try:
+            return _compile_filter(self.current_regex).search
+        except re.error:
+            return None
 
     def compose(self) -> ComposeResult:
         self.log_widget = Log(classes="log-pane", id="log-widget")
@@ -70,27 +248,65 @@ class LogViewScreen(Screen):
         yield Footer()
 
     async def on_mount(self) -> None:
-        self._refresh_log()
         if hasattr(self.log_widget, "border_title"):
             self.log_widget.border_title = f"Logs for {self.server_name}"
+        self._refresh_log()
+        # stdio servers keep logging while their session is open
+        self.set_interval(1.0, self._refresh_log)
+
+    def on_unmount(self) -> None:
+        if self._write_task:
+            self._write_task.cancel()
 
     def _refresh_log(self):
+        if self._write_task and not self._write_task.done():
+            if self.current_regex == self._rendered_regex:
+                return  # still drawing; the next tick picks up anything new
+            self._write_task.cancel()
+        size = self._log_size(self.stderr_file)
+        end = size
+        if size != self._stderr_size:
+            # Still being written: stop at the last complete line and leave a
+            # partial one for a later tick. Once the file stops growing, show
+            # whatever is there (e.g. a process that died mid-line).
+            end = self._last_line_end(self.stderr_file, self._stderr_end, size)
+        self._stderr_size = size
+        if self.current_regex == self._rendered_regex:
+            # Same filter: only append what was logged since the last draw.
+            # New stderr lines can't go below a STDOUT section, so skip those.
+            if end > self._stderr_end and not self.stdout_file:
+                lines = self._iter_lines(self.stderr_file, self._stderr_end, end)
+                self._stderr_end = end
+                self._write_task = asyncio.create_task(self._write_lines(lines, self._line_filter()))
+            return
         self.log_widget.clear()
-        all_lines = self.stderr_lines + (["--- STDOUT ---"] + self.stdout_lines if self.stdout_lines else [])
-        if self.current_regex:
-            import re
-            try:
-                regex = re.compile(self.current_regex, re.IGNORECASE)
-                lines = [line for line in all_lines if regex.search(line)]
-            except Exception:
-                lines = all_lines
-        else:
-            lines = all_lines
-        self.filtered_lines = lines
-        if lines:
-            self.log_widget.write_lines(lines)
-        else:
+        self._rendered_regex = self.current_regex
+        self._stderr_end = end
+        self._lines_written = 0
+        self._notices = []
+        self._placeholder_shown = False
+        self._write_task = asyncio.create_task(self._write_lines(self._all_lines(), self._line_filter()))
+
+    async def _write_lines(self, lines, match=None):
+        # Read, filter and write in batches, yielding to the event loop after
+        # each one, so a filter that rarely matches can't stall the UI
+        while batch := list(islice(lines, _LOG_WRITE_BATCH)):
+            if match is not None:
+                batch = [line for line in batch if isinstance(line, _LogNotice) or match(line)]
+            if batch:
+                if self._placeholder_shown:
+                    # Drop the "no match" placeholder, keeping any notices
+                    self.log_widget.clear()
+                    self.log_widget.write_lines(self._notices)
+                    self._placeholder_shown = False
+                self.log_widget.write_lines(batch)
+                notices = [line for line in batch if isinstance(line, _LogNotice)]
+                self._notices += notices
+                self._lines_written += len(batch) - len(notices)
+            await asyncio.sleep(0)
+        if not self._lines_written and not self._placeholder_shown:
             self.log_widget.write_lines(["(No log lines match filter)"])
+            self._placeholder_shown = True
 
     def action_filter(self):
         if self.filter_input:
@@ -120,7 +336,7 @@ class LogViewScreen(Screen):
             self.app.pop_screen()
 
 class ToolInvokeModal(ModalScreen):
-    CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+    CSS_PATH = _CSS_PATH
     def __init__(self, tool, server, invoke_callback=None):
         super().__init__()
         self.tool = tool
@@ -128,24 +344,30 @@ class ToolInvokeModal(ModalScreen):
         self.invoke_callback = invoke_callback
         self.inputs = {}
         self.result = None
+        schema = getattr(tool, "inputSchema", None)
+        self._properties = schema["properties"] if isinstance(schema, dict) and "properties" in schema else None
+        # Fields the form asks for, in schema order, up to and including "prompt"
+        self._active_fields = []
+        for field_name in self._properties or ():
+            self._active_fields.append(field_name)
+            if field_name == "prompt":
+                break
 
     def compose(self) -> ComposeResult:
         with Container():
             yield Label(f"Invoke tool: {getattr(self.tool, 'name', str(self.tool))}")
-            schema = getattr(self.tool, "inputSchema", None)
-            if schema and isinstance(schema, dict) and "properties" in schema:
-                for field, field_info in schema["properties"].items():
+            if self._properties is not None:
+                for field_name in self._active_fields:
+                    field_info = self._properties[field_name]
                     field_type = field_info.get("type")
                     if field_type == "string":
-                        input_widget = Input(id=f"input_{field}", name=field, placeholder=field)
+                        input_widget = Input(id=f"input_{field_name}", name=field_name, placeholder=field_name)
                     elif field_type == "array" and field_info.get("items", {}).get("type") == "string":
-                        input_widget = Input(id=f"input_{field}", name=field, placeholder=f"{field} (comma or newline separated)", multiline=True)
+                        input_widget = Input(id=f"input_{field_name}", name=field_name, placeholder=f"{field_name} (comma or newline separated)", multiline=True)
                     else:
-                        input_widget = Input(id=f"input_{field}", name=field, placeholder=f"{field} (unsupported type: {field_type})")
-                    self.inputs[field] = input_widget
+                        input_widget = Input(id=f"input_{field_name}", name=field_name, placeholder=f"{field_name} (unsupported type: {field_type})")
+                    self.inputs[field_name] = input_widget
                     yield input_widget
-                    if field == "prompt":
-                        break
             else:
                 # No schema: let user specify key and value
                 key_input = Input(id="input_key", placeholder="argument name (e.g. prompt)", value="prompt")
@@ -157,12 +379,10 @@ class ToolInvokeModal(ModalScreen):
             with Horizontal():
                 yield Button("Invoke", id="invoke", variant="success")
                 yield Button("Cancel", id="cancel", variant="error")
-            self.links_widget = Static("", id="tool-links-widget", classes="tool-links-pane")
-            yield self.links_widget
             self.result = Log(
                 id="tool-result-log",
                 classes="tool-result-log-pane",
-                highlight=True,
+                highlight=False,  # only turned on for JSON results
             )
             yield self.result
 
@@ -170,20 +390,17 @@ class ToolInvokeModal(ModalScreen):
         if event.button.id == "cancel":
             self.dismiss(None)
         elif event.button.id == "invoke":
-            schema = getattr(self.tool, "inputSchema", None)
-            if schema and isinstance(schema, dict) and "properties" in schema:
+            if self._properties is not None:
                 values = {}
-                for field in schema["properties"]:
-                    widget = self.inputs[field]
+                for field_name in self._active_fields:
+                    widget = self.inputs[field_name]
                     val = widget.value
-                    field_type = schema["properties"][field].get("type")
+                    field_type = self._properties[field_name].get("type")
                     if field_type == "array":
                         # Split by newlines or commas for arrays
-                        values[field] = [v.strip() for v in val.replace(',', '\n').splitlines() if v.strip()]
+                        values[field_name] = [v.strip() for v in val.replace(',', '\n').splitlines() if v.strip()]
                     else:
-                        values[field] = val
-                    if field == "prompt":
-                        break
+                        values[field_name] = val
             else:
                 key = self.inputs["key"].value.strip() or "prompt"
                 value = self.inputs["value"].value
@@ -197,36 +414,25 @@ class ToolInvokeModal(ModalScreen):
                         self.display_result(result)
                     except Exception as e:
                         self.result.write(f"[red]Error: {e}[/red]")
-                import asyncio
                 asyncio.create_task(do_invoke())
 
     def display_result(self, result):
-        import json
-        import re
         self.result.clear()
-        self.links_widget.update("")
-        urls = set()
-        try:
-            data = result
-            if isinstance(result, str):
-                data = json.loads(result)
-            pretty = json.dumps(data, indent=2, ensure_ascii=False)
-            urls.update(re.findall(r'https?://\S+', pretty))
-        except Exception:
-            pretty = str(result)
-            urls.update(re.findall(r'https?://\S+', pretty))
-        # Output URLs in the links widget if any
-        if False and urls:
-            def clean_url(url):
-                return url.rstrip('.,;\'\"')
-            links_markup = "[b]Links[/b]\n" + "\n".join(f"[link={clean_url(url)}]{clean_url(url)}[/link]" for url in urls)
-            self.links_widget.update(links_markup)
-        else:
-            self.links_widget.update("")
+        self.result.highlight = False
+        pretty = str(result)
+        # Only objects and arrays are worth pretty-printing; don't try to
+        # parse plain text results as JSON
+        if not isinstance(result, str) or result.lstrip()[:1] in ("{", "["):
+            try:
+                data = orjson.loads(result) if isinstance(result, str) else result
+                pretty = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+                self.result.highlight = True
+            except Exception:
+                pass
         self.result.write(pretty)
 
 class ToolsListScreen(Screen):
-    CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+    CSS_PATH = _CSS_PATH
     BINDINGS = [
         Binding("q", "pop_screen", "Back"),
         Binding("escape", "pop_screen", "Back"),
@@ -239,7 +445,11 @@ class ToolsListScreen(Screen):
         super().__init__(**kwargs)
         self.server_name = server_name
         self.tools = tools if tools is not None else []
-        self.filtered_tools = self.tools
+        # Table rows are built once; filtering just picks which ones to show
+        self._rows = [(getattr(tool, "name", str(tool)), getattr(tool, "description", "")) for tool in self.tools]
+        # Filters are case-insensitive, so match against lowercased text
+        self._tool_haystacks = [f"{getattr(tool, 'name', '')} {getattr(tool, 'description', '') or ''}".lower() for tool in self.tools]
+        self.filtered_idxs = list(range(len(self.tools)))
         self.table = None
         self.server = server
         self.invoke_callback = invoke_callback
@@ -247,24 +457,47 @@ class ToolsListScreen(Screen):
         self.filter_input = None
 
     def compose(self) -> ComposeResult:
-        self.table = DataTable(id="tools-table", classes="tools-table-pane")
-        self.table.border_title = f"Tools for {self.server_name}"
-        self.table.add_column("Name")
-        self.table.add_column("Description")
-        self.table.cursor_type = "row"
-        self._refresh_table()
+        self.table = self._build_table()
+        if FastDataTable is None:
+            self._fill_table()
         yield self.table
         yield Footer()
 
-    def _refresh_table(self):
-        self.table.clear()
-        if self.filtered_tools:
-            for tool in self.filtered_tools:
-                name = getattr(tool, "name", str(tool))
-                desc = getattr(tool, "description", "")
-                self.table.add_row(name, desc)
+    def _build_table(self):
+        if FastDataTable is not None:
+            # Rows are handed to the Arrow backend up front
+            table = FastDataTable(
+                data=self._table_rows(),
+                column_labels=["Name", "Description"],
+                cursor_type="row",
+                id="tools-table",
+                classes="tools-table-pane",
+            )
         else:
-            self.table.add_row("(No tools found or not yet loaded)")
+            table = DataTable(id="tools-table", classes="tools-table-pane")
+            table.add_column("Name")
+            table.add_column("Description")
+            table.cursor_type = "row"
+        table.border_title = f"Tools for {self.server_name}"
+        return table
+
+    def _table_rows(self):
+        if not self.filtered_idxs:
+            return [("(No tools found or not yet loaded)", "")]
+        return [self._rows[i] for i in self.filtered_idxs]
+
+    async def _refresh_table(self):
+        if FastDataTable is not None:
+            # Fast tables can't be cleared in place, so swap in a new one
+            await self.table.remove()
+            self.table = self._build_table()
+            await self.mount(self.table, before=0)
+        else:
+            self._fill_table()
+
+    def _fill_table(self):
+        self.table.clear()
+        self.table.add_rows(self._table_rows())
 
     def action_filter(self):
         if self.filter_input:
@@ -274,20 +507,18 @@ class ToolsListScreen(Screen):
         self.filter_input.focus()
         self.filter_input.border_title = "Filter"
 
-    def on_input_submitted(self, event: Input.Submitted):
+    async def on_input_submitted(self, event: Input.Submitted):
         if self.filter_input and event.input is self.filter_input:
-            import re
             value = self.filter_input.value
             self.current_regex = value or ""
             if not self.current_regex:
-                self.filtered_tools = self.tools
+                self.filtered_idxs = list(range(len(self.tools)))
             else:
                 try:
-                    regex = re.compile(self.current_regex, re.IGNORECASE)
-                    self.filtered_tools = [t for t in self.tools if regex.search(getattr(t, "name", "") + " " + getattr(t, "description", ""))]
-                except Exception:
-                    self.filtered_tools = self.tools
-            self._refresh_table()
+                    self.filtered_idxs = _filter_indices(self.current_regex, self._tool_haystacks)
+                except re.error:
+                    self.filtered_idxs = list(range(len(self.tools)))
+            await self._refresh_table()
             self.filter_input.remove()
             self.filter_input = None
 
@@ -314,9 +545,9 @@ class ToolsListScreen(Screen):
         if not self.table or not self.tools:
             return
         row = self.table.cursor_row
-        if row is None or row >= len(self.tools):
+        if row is None or row >= len(self.filtered_idxs):
             return
-        tool = self.tools[row]
+        tool = self.tools[self.filtered_idxs[row]]
         # Show modal dialog for tool invocation
         self.app.push_screen(ToolInvokeModal(tool, self.server, self.invoke_callback))
 
@@ -327,7 +558,7 @@ class ToolsListScreen(Screen):
         return f"Invoked {getattr(tool, 'name', str(tool))} with {values}"
 
 class ServerListScreen(Screen):
-    CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+    CSS_PATH = _CSS_PATH
     BINDINGS = [
         Binding("l", "show_logs", "Show Logs"),
         Binding("j", "j", "Down"),
@@ -336,18 +567,24 @@ class ServerListScreen(Screen):
         Binding("/", "filter", "Filter"),
     ]
 
-    def __init__(self, servers: List[MCPServer], server_logs, **kwargs):
+    def __init__(self, servers: List[MCPServer], http_client=None, **kwargs):
         super().__init__(**kwargs)
         self.servers = servers
-        self.filtered_servers = self.servers
+        self.states = [ServerState() for _ in servers]
+        # Lowercased text each server is matched against when filtering
+        self._server_haystacks = [f"{s.name} {s.type or ''} {s.command or ''} {s.url or ''}".lower() for s in servers]
+        self.http_client = http_client
+        self.filtered_idxs = list(range(len(servers)))
         self.table = None
-        self._row_keys = []
+        self._row_keys = {}  # server idx -> row key of its visible row
+        self._row_key_to_idx = {}
         self.status_col_key = None
-        self.server_logs = server_logs
-        self.server_tools = {}  # idx -> list of tool objects
-        self.server_sessions = {}  # idx -> (AsyncExitStack, ClientSession)
         self.current_regex = ""
         self.filter_input = None
+        self._sem = asyncio.Semaphore(8)  # caps concurrent health checks
+        self._stdio_sem = asyncio.Semaphore(4)
+        self._checks_task = None
+        self._pending_status = {}  # idx -> status markup not yet drawn
 
     def compose(self) -> ComposeResult:
         self.table = DataTable(id="servers-table", classes="servers-table-pane")
@@ -361,98 +598,131 @@ class ServerListScreen(Screen):
         yield Footer()
 
     async def on_mount(self) -> None:
+        self.set_interval(0.1, self._flush_status)
         self.call_after_refresh(self.start_checks)
 
+    async def on_unmount(self) -> None:
+        # Cancelling the checks also closes the stdio sessions they hold open,
+        # and waiting here means no check outlives the screen
+        if self._checks_task:
+            self._checks_task.cancel()
+            await asyncio.gather(self._checks_task, return_exceptions=True)
+
     def start_checks(self):
-        for idx, server in enumerate(self.servers):
-            asyncio.create_task(self.check_server(idx, server))
+        self._checks_task = asyncio.create_task(self._run_checks())
+
+    async def _run_checks(self):
+        # One parent task for all checks: cancelling it cancels every check.
+        # HTTP probes are cheap, so start them first and they get through the
+        # shared semaphore ahead of the stdio spawns.
+        order = sorted(enumerate(self.servers), key=lambda item: bool(item[1].command or not item[1].url))
+        await asyncio.gather(
+            *(self.check_server(idx, server) for idx, server in order),
+            return_exceptions=True,
+        )
 
     async def check_server(self, idx, server: MCPServer):
-        tools = []
-        session = None
         if not server.command and server.url:
-            stderr_file = tempfile.TemporaryFile(mode="w+")
-            self.server_logs[idx] = (None, stderr_file)
-            self.update_status(idx, "[yellow]●[/yellow]")
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(server.url, timeout=5)
-                    if response.status_code == 200:
-                        self.update_status(idx, "[green]✔[/green]")
-                        # HTTP servers: no tool list
-                    else:
-                        self.update_status(idx, "[red]✗[/red]")
-                        stderr_file.write(f"HTTP status code: {response.status_code}\n")
-                        stderr_file.flush()
-            except Exception as e:
-                self.update_status(idx, "[red]✗[/red]")
-                import traceback
-                stderr_file.write(traceback.format_exc())
-                stderr_file.flush()
-            finally:
-                stderr_file.seek(0)
-                stderr_contents = stderr_file.read()
-                if not stderr_contents:
-                    stderr_file.seek(0)
-                    stderr_file.write("No output captured from HTTP health check or Python exception.")
-                    stderr_file.flush()
-                    stderr_file.seek(0)
-            self.server_tools[idx] = tools
+            # Nothing external writes to this log, so keep it in memory. It's
+            # set before queueing so the log view can open it straight away.
+            self.states[idx].stderr = io.StringIO()
+            async with self._sem:
+                await self._check_http_server(idx, server)
         else:
-            stderr_file = tempfile.TemporaryFile(mode="w+")
-            self.server_logs[idx] = (None, stderr_file)
-            self.update_status(idx, "[yellow]●[/yellow]")
+            await self._check_stdio_server(idx, server)
+
+    async def _check_http_server(self, idx, server: MCPServer):
+        stderr_file = self.states[idx].stderr
+        self.update_status(idx, "[yellow]●[/yellow]")
+        try:
+            # Fail fast on connect; HEAD skips downloading the body
+            timeout = httpx.Timeout(connect=2.0, read=3.0, write=2.0, pool=5.0)
+            response = await self.http_client.head(server.url, timeout=timeout)
+            if response.status_code == 405:
+                # Server doesn't allow HEAD, fall back to GET
+                response = await self.http_client.get(server.url, timeout=timeout)
+            if 200 <= response.status_code < 400:
+                self.update_status(idx, "[green]✔[/green]")
+                # HTTP servers: no tool list
+            else:
+                self.update_status(idx, "[red]✗[/red]")
+                stderr_file.write(f"HTTP status code: {response.status_code}\n")
+        except Exception as e:
+            self.update_status(idx, "[red]✗[/red]")
+            log.exception("HTTP health check failed for %s", server.name)
+            stderr_file.write(traceback.format_exc())
+        finally:
+            if not stderr_file.getvalue():
+                stderr_file.write("No output captured from HTTP health check or Python exception.\n")
+
+    async def _check_stdio_server(self, idx, server: MCPServer):
+        state = self.states[idx]
+        stderr_file = _CountingWriter(tempfile.TemporaryFile(mode="w+b"))
+        state.stderr = stderr_file
+        async with AsyncExitStack() as stack:
             try:
-                command = server.command
-                args = server.args or []
-                env = server.env or None
-                server_params = StdioServerParameters(
-                    command=command,
-                    args=args,
-                    env=env
-                )
-                stack = AsyncExitStack()
-                await stack.__aenter__()
-                stdio, write = await stack.enter_async_context(
-                    stdio_client(server_params, errlog=stderr_file)
-                )
-                session = await stack.enter_async_context(ClientSession(stdio, write))
-                await session.initialize()
-                tool_list = await session.list_tools()
+                # Each stdio check spawns a subprocess, so cap those harder
+                async with self._sem, self._stdio_sem:
+                    self.update_status(idx, "[yellow]●[/yellow]")
+                    command = server.command
+                    args = server.args or []
+                    env = server.env or None
+                    server_params = StdioServerParameters(
+                        command=command,
+                        args=args,
+                        env=env
+                    )
+                    stdio, write = await stack.enter_async_context(
+                        stdio_client(server_params, errlog=stderr_file)
+                    )
+                    session = await stack.enter_async_context(ClientSession(stdio, write))
+                    await session.initialize()
+                    tool_list = await session.list_tools()
                 # Store the full tool objects for invocation
-                if hasattr(tool_list, "tools"):
-                    tools = tool_list.tools
-                else:
-                    tools = tool_list
-                self.server_tools[idx] = tools
-                self.server_sessions[idx] = (stack, session)
+                state.tools = tool_list.tools
+                state.session = session
                 self.update_status(idx, "[green]✔[/green]")
             except Exception as e:
                 self.update_status(idx, "[red]✗[/red]")
-                import traceback
+                log.exception("Connecting to %s failed", server.name)
                 stderr_file.write(traceback.format_exc())
+                return
             finally:
-                stderr_file.seek(0)
-                stderr_contents = stderr_file.read()
-                if not stderr_contents:
-                    stderr_file.seek(0)
-                    stderr_file.write("No output captured from process or Python exception.")
-                    stderr_file.flush()
-                    stderr_file.seek(0)
+                if stderr_file.is_empty():
+                    stderr_file.write("No output captured from process or Python exception.\n")
+                state.checked.set()
+            # Hold the session open for tool calls. The stack has to be exited
+            # by the task that entered it, so shutdown cancels this task.
+            try:
+                await asyncio.Event().wait()
+            finally:
+                state.session = None
 
     def update_status(self, idx, status):
-        if self.table and self.status_col_key is not None:
-            self.table.update_cell(self._row_keys[idx], self.status_col_key, status)
+        self.states[idx].status = status
+        # Coalesced and drawn by _flush_status, so a check's yellow -> green
+        # transition costs one table update rather than two
+        self._pending_status[idx] = status
+
+    def _flush_status(self):
+        if not self._pending_status or not self.table or self.status_col_key is None:
+            return
+        pending, self._pending_status = self._pending_status, {}
+        with self.app.batch_update():
+            for idx, status in pending.items():
+                row_key = self._row_keys.get(idx)
+                if row_key is not None:
+                    self.table.update_cell(row_key, self.status_col_key, status)
 
     def action_show_logs(self):
         if not self.table or not self._row_keys:
             return
         row = self.table.cursor_row
-        if row is None or row >= len(self.servers):
+        if row is None or row >= len(self.filtered_idxs):
             return
-        server = self.servers[row]
-        logs = self.server_logs.get(row, (None, None))
-        self.app.push_screen(LogViewScreen(server.name, logs[0], logs[1]))
+        idx = self.filtered_idxs[row]
+        state = self.states[idx]
+        self.app.push_screen(LogViewScreen(self.servers[idx].name, state.stdout, state.stderr))
 
     def action_j(self):
         if self.table:
@@ -475,17 +745,15 @@ class ServerListScreen(Screen):
 
     def on_input_submitted(self, event: Input.Submitted):
         if self.filter_input and event.input is self.filter_input:
-            import re
             value = self.filter_input.value
             self.current_regex = value or ""
             if not self.current_regex:
-                self.filtered_servers = self.servers
+                self.filtered_idxs = list(range(len(self.servers)))
             else:
                 try:
-                    regex = re.compile(self.current_regex, re.IGNORECASE)
-                    self.filtered_servers = [s for s in self.servers if regex.search(s.name + " " + (s.type or "") + " " + (s.command or "") + " " + (s.url or ""))]
-                except Exception:
-                    self.filtered_servers = self.servers
+                    self.filtered_idxs = _filter_indices(self.current_regex, self._server_haystacks)
+                except re.error:
+                    self.filtered_idxs = list(range(len(self.servers)))
             self._refresh_table()
             self.filter_input.remove()
             self.filter_input = None
@@ -497,35 +765,23 @@ class ServerListScreen(Screen):
 
     def _refresh_table(self):
         self.table.clear()
-        self._row_keys = []
-        for server in self.filtered_servers:
-            name = server.name
-            status = ""
-            if server.type:
-                type_ = server.type
-            elif server.command:
-                type_ = "stdio"
-            elif server.url:
-                type_ = "http"
-            else:
-                type_ = ""
-            row_key = self.table.add_row(name, status, type_)
-            self._row_keys.append(row_key)
+        self._row_keys = {}
+        self._row_key_to_idx = {}
+        for idx in self.filtered_idxs:
+            server = self.servers[idx]
+            row_key = self.table.add_row(server.name, self.states[idx].status, server.display_type)
+            self._row_keys[idx] = row_key
+            self._row_key_to_idx[row_key] = idx
 
     def on_data_table_row_selected(self, event):
         if not self.table or not self._row_keys:
             return
-        try:
-            idx = self._row_keys.index(event.row_key)
-        except ValueError:
-            return
-        if idx >= len(self.servers):
+        idx = self._row_key_to_idx.get(event.row_key)
+        if idx is None:
             return
         server = self.servers[idx]
-        tools = self.server_tools.get(idx, [])
-        session_tuple = self.server_sessions.get(idx)
-        session = session_tuple[1] if session_tuple else None
-        self.app.push_screen(ToolsListScreen(server.name, tools, server, invoke_callback=self.make_invoke_callback(session)))
+        state = self.states[idx]
+        self.app.push_screen(ToolsListScreen(server.name, state.tools, server, invoke_callback=self.make_invoke_callback(state.session)))
 
     def make_invoke_callback(self, session):
         async def invoke_tool(tool, server, values):
@@ -556,20 +812,28 @@ class ServerListScreen(Screen):
                     return str(result.content)
                 return str(result)
             except Exception as e:
-                import traceback
                 return f"Error invoking tool: {e}\n{traceback.format_exc()}"
         return invoke_tool
 
 class MCPServerListApp(App):
-    CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+    CSS_PATH = _CSS_PATH
 
     def __init__(self, servers: List[MCPServer], **kwargs):
         super().__init__(**kwargs)
         self.servers = servers
-        self.server_logs = {}  # idx -> (stdout, stderr)
+        self.http_client = None  # shared by all HTTP health checks
 
     def on_mount(self):
-        self.push_screen(ServerListScreen(self.servers, self.server_logs))
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=5,
+        )
+        self.push_screen(ServerListScreen(self.servers, self.http_client))
+
+    async def on_unmount(self):
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
 
 @app_cli.command()
 def main(
@@ -579,6 +843,7 @@ def main(
     server_name: Optional[str] = typer.Option("Custom MCP Server", "--server-name", help="Name for the MCP server when using --server-cmd"),
 ) -> None:
     """Open a TUI listing MCP servers from a mcp.json file, or connect to a single stdio MCP server if --server-cmd is given."""
+    logging.basicConfig(handlers=[TextualHandler()])
     if server_cmd:
         # User specified a command, connect to it as a stdio MCP server
         server = MCPServer(
@@ -589,34 +854,33 @@ def main(
         )
         # Show tools for this server directly (skip server list if only one server)
         class SingleServerApp(App):
-            CSS_PATH = importlib.resources.files("mcp_tui").joinpath("app.tcss")
+            CSS_PATH = _CSS_PATH
             def __init__(self, server: MCPServer, **kwargs):
                 super().__init__(**kwargs)
                 self.server = server
-                self.server_logs = {0: (None, None)}
+                self._check_task = None
             async def on_mount(self):
-                # Reuse ServerListScreen logic to connect and get tools
-                screen = ServerListScreen([self.server], self.server_logs)
-                await screen.check_server(0, self.server)
-                tools = screen.server_tools.get(0, [])
-                session_tuple = screen.server_sessions.get(0)
-                session = session_tuple[1] if session_tuple else None
-                self.push_screen(ToolsListScreen(self.server.name, tools, self.server, invoke_callback=screen.make_invoke_callback(session)))
+                # Reuse ServerListScreen logic to connect and get tools. The
+                # check keeps running afterwards to hold the session open.
+                screen = ServerListScreen([self.server])
+                self._check_task = asyncio.create_task(screen.check_server(0, self.server))
+                state = screen.states[0]
+                await state.checked.wait()
+                self.push_screen(ToolsListScreen(self.server.name, state.tools, self.server, invoke_callback=screen.make_invoke_callback(state.session)))
+            async def on_unmount(self):
+                if self._check_task:
+                    self._check_task.cancel()
+                    await asyncio.gather(self._check_task, return_exceptions=True)
         SingleServerApp(server).run()
         return
     # Default: load from mcp.json
     if not mcp_json:
         typer.echo("Error: You must specify either a path to mcp.json or --server-cmd.")
         raise typer.Exit(1)
-    with mcp_json.open() as f:
-        data = json.load(f)
+    data = orjson.loads(mcp_json.read_bytes())
     # Adjusted for ~/.cursor/mcp.json structure
-    servers = []
     mcp_servers = data.get("mcpServers", {})
-    for name, config in mcp_servers.items():
-        config = dict(config)  # ensure it's a dict
-        config["name"] = name
-        servers.append(MCPServer(**config))
+    servers = _SERVERS_ADAPTER.validate_python([{**config, "name": name} for name, config in mcp_servers.items()])
     MCPServerListApp(servers).run()
 
 if __name__ == "__main__":